@@ -11,6 +11,7 @@ This module provides:
 - VM: Stack-based virtual machine with trace hooks
 """
 
+import sys
 from enum import Enum, auto
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional, Tuple, Callable
@@ -35,68 +36,103 @@ from cnsc.haai.nsc.gates import (
 from cnsc.haai.nsc.proposer_client import ProposerClient
 
 
-@dataclass
 class VMStack:
     """
     VM Operand Stack.
 
-    Stack implementation for VM operand management.
+    Slotted stack over a single Python list. Push and pop go straight to the
+    list's C-level ``append``/``pop`` so the per-instruction cost is one bound
+    check; the list's own over-allocation provides amortised capacity.
     """
 
-    stack: List[Any] = field(default_factory=list)
-    max_size: int = 1024
+    __slots__ = ("_items", "max_size")
+
+    def __init__(self, stack: Optional[List[Any]] = None, max_size: int = 1024):
+        self._items: List[Any] = list(stack) if stack else []
+        self.max_size = max_size
+
+    @property
+    def stack(self) -> List[Any]:
+        """Underlying value list, bottom first."""
+        return self._items
 
     def push(self, value: Any) -> bool:
         """Push value onto stack."""
-        if len(self.stack) >= self.max_size:
+        items = self._items
+        if len(items) >= self.max_size:
             return False
-        self.stack.append(value)
+        items.append(value)
         return True
 
     def pop(self) -> Optional[Any]:
         """Pop value from stack."""
-        if not self.stack:
-            return None
-        return self.stack.pop()
+        items = self._items
+        return items.pop() if items else None
+
+    def pop2(self) -> Tuple[Any, Any]:
+        """Pop the top two values as ``(below, top)`` for binary operators."""
+        items = self._items
+        if len(items) >= 2:
+            b = items.pop()
+            return items.pop(), b
+        b = items.pop() if items else None
+        return None, b
 
     def peek(self, offset: int = 0) -> Optional[Any]:
         """Peek at stack value without popping."""
-        index = len(self.stack) - 1 - offset
-        if 0 <= index < len(self.stack):
-            return self.stack[index]
+        items = self._items
+        index = len(items) - 1 - offset
+        if 0 <= index < len(items):
+            return items[index]
         return None
 
     def dup(self) -> bool:
         """Duplicate top value."""
-        if not self.stack:
+        if not self._items:
             return False
-        return self.push(self.stack[-1])
+        return self.push(self._items[-1])
 
     def swap(self) -> bool:
         """Swap top two values."""
-        if len(self.stack) < 2:
+        items = self._items
+        if len(items) < 2:
             return False
-        self.stack[-1], self.stack[-2] = self.stack[-2], self.stack[-1]
+        items[-1], items[-2] = items[-2], items[-1]
         return True
 
     def clear(self) -> None:
         """Clear the stack."""
-        self.stack.clear()
+        self._items.clear()
 
     def size(self) -> int:
         """Get stack size."""
-        return len(self.stack)
+        return len(self._items)
 
     def is_empty(self) -> bool:
         """Check if stack is empty."""
-        return len(self.stack) == 0
+        return not self._items
 
     def to_list(self) -> List[Any]:
         """Get stack as list."""
-        return self.stack.copy()
+        return self._items.copy()
 
+    def memory_bytes(self) -> int:
+        """Shallow bytes held by the stack object and its list (incl. spare capacity)."""
+        return sys.getsizeof(self) + sys.getsizeof(self._items)
 
-@dataclass
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, VMStack):
+            return NotImplemented
+        return self.max_size == other.max_size and self._items == other._items
+
+    def __repr__(self) -> str:
+        return f"VMStack(stack={self._items!r}, max_size={self.max_size})"
+
+
+@dataclass(slots=True)
 class VMFrame:
     """
     VM Stack Frame.
@@ -135,6 +171,15 @@ class VMFrame:
         self.locals[name] = None
         self.local_types[name] = value_type
 
+    def memory_bytes(self) -> int:
+        """Shallow bytes held by the frame, its local tables and its stack."""
+        return (
+            sys.getsizeof(self)
+            + sys.getsizeof(self.locals)
+            + sys.getsizeof(self.local_types)
+            + self.stack.memory_bytes()
+        )
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
         return {
@@ -203,12 +248,17 @@ class VMState:
             return self.call_stack[-1]
         return None
 
+    def get_memory_bytes(self) -> int:
+        """Total shallow bytes held by frames on the call stack."""
+        return sum(frame.memory_bytes() for frame in self.call_stack)
+
     def get_stats(self) -> Dict[str, Any]:
         """Get execution statistics."""
         return {
             "instruction_count": self.instruction_count,
             "cycle_count": self.cycle_count,
             "call_stack_depth": len(self.call_stack),
+            "frame_memory_bytes": self.get_memory_bytes(),
             "is_running": self.is_running,
             "is_halted": self.is_halted,
             "coherence_level": self.coherence_level,
@@ -499,29 +549,31 @@ class VM:
         if self.state.on_instruction:
             self.state.on_instruction(opcode, operands, frame)
 
+        stack = frame.stack
+
         # Stack operations
         if opcode == NSCOpcode.PUSH:
-            frame.stack.push(operands[0] if operands else None)
+            stack.push(operands[0] if operands else None)
 
         elif opcode == NSCOpcode.POP:
-            frame.stack.pop()
+            stack.pop()
 
         elif opcode == NSCOpcode.DUP:
-            frame.stack.dup()
+            stack.dup()
 
         elif opcode == NSCOpcode.SWAP:
-            frame.stack.swap()
+            stack.swap()
 
         # Local operations
         elif opcode == NSCOpcode.LOAD:
             name = operands[0] if operands else None
             value = frame.load(name)
             if value is not None:
-                frame.stack.push(value)
+                stack.push(value)
 
         elif opcode == NSCOpcode.STORE:
             name = operands[0] if operands else None
-            value = frame.stack.pop()
+            value = stack.pop()
             frame.store(name, value)
 
         elif opcode == NSCOpcode.ALLOC:
@@ -531,64 +583,54 @@ class VM:
 
         # Arithmetic
         elif opcode == NSCOpcode.ADD:
-            b = frame.stack.pop()
-            a = frame.stack.pop()
-            frame.stack.push(a + b)
+            a, b = stack.pop2()
+            stack.push(a + b)
 
         elif opcode == NSCOpcode.SUB:
-            b = frame.stack.pop()
-            a = frame.stack.pop()
-            frame.stack.push(a - b)
+            a, b = stack.pop2()
+            stack.push(a - b)
 
         elif opcode == NSCOpcode.MUL:
-            b = frame.stack.pop()
-            a = frame.stack.pop()
-            frame.stack.push(a * b)
+            a, b = stack.pop2()
+            stack.push(a * b)
 
         elif opcode == NSCOpcode.DIV:
-            b = frame.stack.pop()
-            a = frame.stack.pop()
-            frame.stack.push(a / b)
+            a, b = stack.pop2()
+            stack.push(a / b)
 
         elif opcode == NSCOpcode.NEG:
-            a = frame.stack.pop()
-            frame.stack.push(-a)
+            a = stack.pop()
+            stack.push(-a)
 
         # Comparison
         elif opcode == NSCOpcode.EQ:
-            b = frame.stack.pop()
-            a = frame.stack.pop()
-            frame.stack.push(a == b)
+            a, b = stack.pop2()
+            stack.push(a == b)
 
         elif opcode == NSCOpcode.NE:
-            b = frame.stack.pop()
-            a = frame.stack.pop()
-            frame.stack.push(a != b)
+            a, b = stack.pop2()
+            stack.push(a != b)
 
         elif opcode == NSCOpcode.LT:
-            b = frame.stack.pop()
-            a = frame.stack.pop()
-            frame.stack.push(a < b)
+            a, b = stack.pop2()
+            stack.push(a < b)
 
         elif opcode == NSCOpcode.GT:
-            b = frame.stack.pop()
-            a = frame.stack.pop()
-            frame.stack.push(a > b)
+            a, b = stack.pop2()
+            stack.push(a > b)
 
         # Logical
         elif opcode == NSCOpcode.AND:
-            b = frame.stack.pop()
-            a = frame.stack.pop()
-            frame.stack.push(a and b)
+            a, b = stack.pop2()
+            stack.push(a and b)
 
         elif opcode == NSCOpcode.OR:
-            b = frame.stack.pop()
-            a = frame.stack.pop()
-            frame.stack.push(a or b)
+            a, b = stack.pop2()
+            stack.push(a or b)
 
         elif opcode == NSCOpcode.NOT:
-            a = frame.stack.pop()
-            frame.stack.push(not a)
+            a = stack.pop()
+            stack.push(not a)
 
         # Control flow
         elif opcode == NSCOpcode.JUMP:
@@ -596,19 +638,19 @@ class VM:
             self.state.program_counter = target
 
         elif opcode == NSCOpcode.JUMP_IF:
-            condition = frame.stack.pop()
+            condition = stack.pop()
             target = operands[0] if operands else 0
             if condition:
                 self.state.program_counter = target
 
         elif opcode == NSCOpcode.JUMP_IF_NOT:
-            condition = frame.stack.pop()
+            condition = stack.pop()
             target = operands[0] if operands else 0
             if not condition:
                 self.state.program_counter = target
 
         elif opcode == NSCOpcode.RET:
-            frame.return_value = frame.stack.pop()
+            frame.return_value = stack.pop()
             return False  # Exit frame
 
         elif opcode == NSCOpcode.CALL:
@@ -625,11 +667,11 @@ class VM:
 
         # Coherence operations
         elif opcode == NSCOpcode.COHERENCE_READ:
-            self.state.coherence_level = frame.stack.pop()
+            self.state.coherence_level = stack.pop()
 
         elif opcode == NSCOpcode.COHERENCE_WRITE:
-            value = frame.stack.pop()
-            frame.stack.push(self.state.coherence_level)
+            value = stack.pop()
+            stack.push(self.state.coherence_level)
 
         elif opcode == NSCOpcode.COHERENCE_CHECK:
             required = operands[0] if operands else 0.5
@@ -641,20 +683,20 @@ class VM:
         # Gate operations
         elif opcode == NSCOpcode.GATE_EVAL:
             gate_name = operands[0] if operands else None
-            context = frame.stack.pop() if not frame.stack.is_empty() else {}
+            context = stack.pop() if not stack.is_empty() else {}
             result = self._evaluate_gate(gate_name, context if isinstance(context, dict) else {})
-            frame.stack.push(result)
+            stack.push(result)
 
         # Trace operations
         elif opcode == NSCOpcode.TRACE_EVENT:
             event_type = operands[0] if operands else "generic"
             if self.state.on_trace:
-                self.state.on_trace(event_type, frame.stack.pop())
+                self.state.on_trace(event_type, stack.pop())
 
         elif opcode == NSCOpcode.EMIT_RECEIPT:
             if self.state.on_receipt:
                 receipt = self.state.on_receipt()
-                frame.stack.push(receipt)
+                stack.push(receipt)
 
         # Special
         elif opcode == NSCOpcode.HALT:
@@ -355,6 +355,23 @@ class TestVMStack(unittest.TestCase):
         self.assertEqual(stack.peek(), 2)  # Now 2 and 3 are swapped
         self.assertEqual(stack.peek(1), 2)
 
+    def test_max_size_and_pop2(self):
+        """Test bounded push and paired pop."""
+        stack = VMStack(max_size=2)
+        self.assertTrue(stack.push(1))
+        self.assertTrue(stack.push(2))
+        self.assertFalse(stack.push(3))
+
+        self.assertEqual(stack.pop2(), (1, 2))
+        self.assertTrue(stack.is_empty())
+        self.assertEqual(stack.pop2(), (None, None))
+
+    def test_slots(self):
+        """Test stack carries no per-instance dict."""
+        stack = VMStack()
+        self.assertFalse(hasattr(stack, "__dict__"))
+        self.assertGreater(stack.memory_bytes(), 0)
+
 
 class TestVMFrame(unittest.TestCase):
     """Tests for VMFrame."""
@@ -373,6 +390,16 @@ class TestVMFrame(unittest.TestCase):
         frame.alloc("y", NSCType(type_id="int", name="int", is_primitive=True))
         self.assertIn("y", frame.local_types)
 
+    def test_memory_accounting(self):
+        """Test per-frame memory accounting."""
+        frame = VMFrame(function_id="f1", function_name="test")
+        self.assertFalse(hasattr(frame, "__dict__"))
+
+        before = frame.memory_bytes()
+        for i in range(100):
+            frame.stack.push(i)
+        self.assertGreater(frame.memory_bytes(), before)
+
 
 class TestVMState(unittest.TestCase):
     """Tests for VMState."""